@@ -7,17 +7,24 @@ Then run these examples in a separate terminal
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import json
+from websockets.sync.client import connect
 
 BASE_URL = "http://localhost:8000/api/v1"
+WS_URL = "ws://localhost:8000/ws"
+
+# One keep-alive connection pool for every call below
+session = requests.Session()
+session.mount("http://", HTTPAdapter(pool_maxsize=32))
 
 
 def submit_simple_task():
     """Submit a simple task"""
     print("\n=== Submitting Simple Task ===")
     
-    response = requests.post(
+    response = session.post(
         f"{BASE_URL}/tasks",
         json={
             "func_name": "hello_world",
@@ -36,7 +43,7 @@ def submit_task_with_kwargs():
     """Submit task with keyword arguments"""
     print("\n=== Submitting Task with Kwargs ===")
     
-    response = requests.post(
+    response = session.post(
         f"{BASE_URL}/tasks",
         json={
             "func_name": "add_numbers",
@@ -54,7 +61,7 @@ def submit_slow_task():
     """Submit a task that takes time"""
     print("\n=== Submitting Slow Task ===")
     
-    response = requests.post(
+    response = session.post(
         f"{BASE_URL}/tasks",
         json={
             "func_name": "slow_task",
@@ -72,7 +79,7 @@ def check_task_status(task_id):
     """Check task status"""
     print(f"\n=== Checking Task {task_id} ===")
     
-    response = requests.get(f"{BASE_URL}/tasks/{task_id}")
+    response = session.get(f"{BASE_URL}/tasks/{task_id}")
     task = response.json()
     
     print(f"Status: {task['status']}")
@@ -84,29 +91,41 @@ def check_task_status(task_id):
 
 
 def wait_for_task_completion(task_id, timeout=30):
-    """Poll task until it completes"""
+    """Wait for a task to finish using WebSocket updates instead of polling"""
     print(f"\n=== Waiting for Task {task_id} ===")
     
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        task = check_task_status(task_id)
+    deadline = time.time() + timeout
+    with connect(WS_URL) as ws:
+        ws.send(json.dumps({"type": "subscribe", "task_id": task_id}))
         
-        if task['status'] in ['completed', 'failed']:
-            print(f"\nTask finished with status: {task['status']}")
-            return task
+        # The task may have finished before the subscription was registered
+        task = check_task_status(task_id)
         
-        print(".", end="", flush=True)
-        time.sleep(1)
-    
-    print(f"\nTimeout waiting for task")
-    return None
+        while task['status'] not in ['completed', 'failed']:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                print(f"\nTimeout waiting for task")
+                return None
+            
+            try:
+                message = json.loads(ws.recv(timeout=remaining))
+            except TimeoutError:
+                continue
+            
+            # Dashboard broadcasts carry other tasks too
+            if message.get('task', {}).get('task_id') == task_id:
+                task = message['task']
+                print(".", end="", flush=True)
+    
+    print(f"\nTask finished with status: {task['status']}")
+    return task
 
 
 def list_all_tasks():
     """List all tasks"""
     print("\n=== All Tasks ===")
     
-    response = requests.get(f"{BASE_URL}/tasks")
+    response = session.get(f"{BASE_URL}/tasks")
     tasks = response.json()
     
     for task in tasks:
@@ -117,7 +136,7 @@ def create_periodic_task():
     """Create a periodic task"""
     print("\n=== Creating Periodic Task ===")
     
-    response = requests.post(
+    response = session.post(
         f"{BASE_URL}/periodic-tasks",
         json={
             "name": "daily_cleanup",
@@ -135,7 +154,7 @@ def create_test_periodic_task():
     """Create a periodic task that runs every minute (for testing)"""
     print("\n=== Creating Test Periodic Task ===")
     
-    response = requests.post(
+    response = session.post(
         f"{BASE_URL}/periodic-tasks",
         json={
             "name": "test_task",
@@ -153,7 +172,7 @@ def list_periodic_tasks():
     """List all periodic tasks"""
     print("\n=== Periodic Tasks ===")
     
-    response = requests.get(f"{BASE_URL}/periodic-tasks")
+    response = session.get(f"{BASE_URL}/periodic-tasks")
     tasks = response.json()
     
     for name, info in tasks.items():
@@ -168,7 +187,7 @@ def trigger_periodic_task(name):
     """Manually trigger a periodic task"""
     print(f"\n=== Triggering Periodic Task: {name} ===")
     
-    response = requests.post(f"{BASE_URL}/periodic-tasks/{name}/trigger")
+    response = session.post(f"{BASE_URL}/periodic-tasks/{name}/trigger")
     result = response.json()
     
     print(result['message'])
@@ -180,7 +199,7 @@ def get_system_metrics():
     """Get system metrics"""
     print("\n=== System Metrics ===")
     
-    response = requests.get(f"{BASE_URL}/metrics")
+    response = session.get(f"{BASE_URL}/metrics")
     metrics = response.json()
     
     print(json.dumps(metrics, indent=2))
@@ -190,7 +209,7 @@ def list_registered_tasks():
     """List all registered task functions"""
     print("\n=== Registered Task Functions ===")
     
-    response = requests.get(f"{BASE_URL}/registered-tasks")
+    response = session.get(f"{BASE_URL}/registered-tasks")
     tasks = response.json()
     
     print(f"Available tasks: {', '.join(tasks['tasks'])}")
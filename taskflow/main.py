@@ -3,7 +3,9 @@
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 import logging
+import os
 import uvicorn
 
 from taskflow.core.queue import TaskQueue
@@ -12,8 +14,9 @@ from taskflow.core.scheduler import TaskScheduler
 from taskflow.api import routes
 from taskflow.api.websocket import websocket_endpoint, task_event_handler
 
-# Add this after imports, before creating the app
-from examples.sample_tasks import *  # Register all tasks
+# Register the bundled sample tasks unless disabled (TASKFLOW_LOAD_SAMPLES=0)
+if os.getenv("TASKFLOW_LOAD_SAMPLES", "1") == "1":
+    import examples.sample_tasks  # noqa: F401
 
 # Configure logging
 logging.basicConfig(
@@ -41,7 +44,8 @@ async def lifespan(app: FastAPI):
     worker_pool = WorkerPool(
         queue=queue,
         num_workers=4,
-        event_callback=task_event_handler  # Connect to WebSocket handler
+        event_callback=task_event_handler,  # Connect to WebSocket handler
+        thread_pool_size=int(os.getenv("TASKFLOW_THREAD_POOL_SIZE", "0")) or None,
     )
     scheduler = TaskScheduler(queue=queue)
     
@@ -67,6 +71,9 @@ async def lifespan(app: FastAPI):
 
 
 # Create FastAPI app
+# No custom default_response_class: since FastAPI 0.130 routes with a
+# response_model are serialized straight to JSON bytes by pydantic-core,
+# which is faster than ORJSONResponse and is disabled by overriding it.
 app = FastAPI(
     title="TaskFlow",
     description="A modern task scheduling and execution system",
@@ -79,7 +86,7 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=["GET", "POST", "DELETE"],
     allow_headers=["*"],
 )
 
@@ -103,11 +110,17 @@ async def root():
     }
 
 
+async def _empty() -> dict:
+    return {}
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    queue_metrics = await queue.get_metrics() if queue else {}
-    worker_stats = await worker_pool.get_stats() if worker_pool else {}
+    queue_metrics, worker_stats = await asyncio.gather(
+        queue.get_metrics() if queue else _empty(),
+        worker_pool.get_stats() if worker_pool else _empty(),
+    )
     
     return {
         "status": "healthy",
@@ -121,6 +134,8 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,  # Auto-reload on code changes
+        reload=os.getenv("TASKFLOW_DEV") == "1",  # Auto-reload on code changes
+        loop="auto",  # uvloop where installed (not on Windows), else asyncio
+        http="httptools",
         log_level="info"
     )
\ No newline at end of file
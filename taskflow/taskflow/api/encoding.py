@@ -0,0 +1,64 @@
+# taskflow/api/encoding.py
+
+from typing import Any, AsyncIterator, Iterable, Optional
+import orjson
+from fastapi.responses import Response, StreamingResponse
+from pydantic_core import to_jsonable_python
+from ..core.task import TERMINAL_STATUSES
+
+
+def dumps(content: Any) -> bytes:
+    """Encode content to JSON bytes with orjson
+    
+    Task results may use non-string dict keys or types orjson does not know
+    (sets, Decimal, ...); those fall back to pydantic's encoding, as FastAPI does.
+    """
+    return orjson.dumps(content, default=to_jsonable_python, option=orjson.OPT_NON_STR_KEYS)
+
+
+def task_json(task, data: Optional[dict] = None) -> orjson.Fragment:
+    """task.to_dict() as already-encoded JSON, for embedding in responses
+    
+    Pass `data` to encode a dict already taken from the task, such as an
+    event's snapshot. Finished tasks never change, so their encoding is kept
+    on the task and reused by every later response or event.
+    """
+    if data is None:
+        data = task.to_dict()
+    # Only the finished task's own dict is cached, never an earlier snapshot
+    finished = task.status in TERMINAL_STATUSES and data is task.to_dict()
+    if finished and task.json_cache is not None:
+        return orjson.Fragment(task.json_cache)
+    encoded = dumps(data)
+    if finished:
+        task.json_cache = encoded
+    return orjson.Fragment(encoded)
+
+
+def json_response(content: Any, status_code: int = 200) -> Response:
+    """JSON response for content that is already in its final shape"""
+    return Response(content=dumps(content), status_code=status_code, media_type="application/json")
+
+
+async def _iter_json_array(rows: Iterable[Any], chunk_size: int) -> AsyncIterator[bytes]:
+    yield b"["
+    separator = b""
+    chunk = []
+    for row in rows:
+        chunk.append(dumps(row))
+        if len(chunk) >= chunk_size:
+            yield separator + b",".join(chunk)
+            separator = b","
+            chunk = []
+    if chunk:
+        yield separator + b",".join(chunk)
+    yield b"]"
+
+
+def json_array_stream(rows: Iterable[Any], chunk_size: int = 100) -> StreamingResponse:
+    """Stream rows as a JSON array, encoding `chunk_size` rows at a time
+    
+    `rows` is consumed lazily, so only one chunk of encoded rows is held in
+    memory instead of the whole response.
+    """
+    return StreamingResponse(_iter_json_array(rows, chunk_size), media_type="application/json")
@@ -1,13 +1,17 @@
 # taskflow/api/routes.py
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Query
 from typing import Any, Optional, List
 from datetime import datetime
+import functools
+import heapq
+import time
 from pydantic import BaseModel, Field
-from ..core.task import Task, TaskStatus, TaskPriority
+from ..core.task import Task, TaskStatus, NORMAL
 from ..core.queue import TaskQueue
 from ..core.scheduler import TaskScheduler
 from ..core.registry import task_registry
+from .encoding import json_array_stream, json_response, task_json
 
 router = APIRouter()
 
@@ -15,12 +19,23 @@ router = APIRouter()
 _queue: Optional[TaskQueue] = None
 _scheduler: Optional[TaskScheduler] = None
 
+# Dashboards poll /metrics; serve a snapshot for up to this many seconds
+METRICS_TTL = 1.0
+_metrics_cache: tuple[float, Optional[dict]] = (0.0, None)  # (monotonic time, response)
+
 
 def init_routes(queue: TaskQueue, scheduler: TaskScheduler):
     """Initialize routes with queue and scheduler instances"""
-    global _queue, _scheduler
+    global _queue, _scheduler, _metrics_cache
     _queue = queue
     _scheduler = scheduler
+    _metrics_cache = (0.0, None)
+
+
+@functools.lru_cache(maxsize=1)
+def _available_tasks(registry_version: int) -> str:
+    """Registered task names for error messages, rebuilt only when the registry changes"""
+    return str(list(task_registry.list_tasks()))
 
 
 # Pydantic models for API
@@ -28,14 +43,23 @@ class TaskCreate(BaseModel):
     func_name: str = Field(..., description="Name of registered task function")
     args: List = Field(default_factory=list, description="Positional arguments")
     kwargs: dict = Field(default_factory=dict, description="Keyword arguments")
-    priority: int = Field(default=TaskPriority.NORMAL.value, description="Task priority (0=highest)")
+    priority: int = Field(default=NORMAL, description="Task priority (0=highest)")
     max_retries: int = Field(default=3, description="Maximum retry attempts")
     timeout: Optional[int] = Field(default=None, description="Task timeout in seconds")
 
 
 class TaskResponse(BaseModel):
+    """Task as returned by the API
+    
+    Mirrors Task.to_dict(). Lookup and list endpoints return the task's
+    encoded dict directly: the data comes from our own Task objects, and
+    finished tasks keep their encoding cached, so per-item validation would
+    only repeat work.
+    """
     task_id: str
     func_name: str
+    args: List
+    kwargs: dict
     status: str
     priority: int
     created_at: str
@@ -44,6 +68,7 @@ class TaskResponse(BaseModel):
     result: Optional[Any]=None
     error: Optional[str]
     retry_count: int
+    max_retries: int
 
 
 class PeriodicTaskCreate(BaseModel):
@@ -52,7 +77,7 @@ class PeriodicTaskCreate(BaseModel):
     cron_expression: str = Field(..., description="Cron expression (e.g., '*/5 * * * *')")
     args: List = Field(default_factory=list)
     kwargs: dict = Field(default_factory=dict)
-    priority: int = Field(default=TaskPriority.NORMAL.value)
+    priority: int = Field(default=NORMAL)
     max_retries: int = Field(default=3)
     timeout: Optional[int] = Field(default=None)
 
@@ -62,13 +87,11 @@ class PeriodicTaskCreate(BaseModel):
 async def create_task(task_data: TaskCreate):
     """Submit a new task for execution"""
     # Verify function exists in registry
-    try:
-        task_registry.get(task_data.func_name)
-    except KeyError:
+    if task_data.func_name not in task_registry:
         raise HTTPException(
             status_code=404,
             detail=f"Task function '{task_data.func_name}' not found. "
-                   f"Available tasks: {task_registry.list_tasks()}"
+                   f"Available tasks: {_available_tasks(task_registry.version)}"
         )
     
     # Create task
@@ -89,6 +112,37 @@ async def create_task(task_data: TaskCreate):
     return TaskResponse(**task.to_dict())
 
 
+@router.post("/tasks/bulk", response_model=List[TaskResponse], status_code=201)
+async def create_tasks_bulk(tasks_data: List[TaskCreate]):
+    """Submit several tasks in one request"""
+    # Verify all functions exist in registry in one pass
+    missing = sorted({t.func_name for t in tasks_data if t.func_name not in task_registry})
+    if missing:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Task functions {missing} not found. "
+                   f"Available tasks: {_available_tasks(task_registry.version)}"
+        )
+    
+    tasks = [
+        Task(
+            func_name=task_data.func_name,
+            args=tuple(task_data.args),
+            kwargs=task_data.kwargs,
+            priority=task_data.priority,
+            max_retries=task_data.max_retries,
+            timeout=task_data.timeout,
+        )
+        for task_data in tasks_data
+    ]
+    
+    success = await _queue.enqueue_many(tasks)
+    if not success:
+        raise HTTPException(status_code=500, detail="Failed to enqueue tasks")
+    
+    return json_response([t.to_dict() for t in tasks], status_code=201)
+
+
 @router.get("/tasks/{task_id}", response_model=TaskResponse)
 async def get_task(task_id: str):
     """Get task status and details"""
@@ -96,7 +150,21 @@ async def get_task(task_id: str):
     if not task:
         raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
     
-    return TaskResponse(**task.to_dict())
+    return json_response(task_json(task))
+
+
+@router.get("/tasks/{task_id}/wait", response_model=TaskResponse)
+async def wait_for_task(task_id: str, timeout: float = Query(default=20.0, ge=0, le=60)):
+    """Wait up to `timeout` seconds for a task to finish, then return it
+    
+    Returns the task as it is if it is still unfinished when the timeout
+    passes, so clients can call again.
+    """
+    task = await _queue.wait_for_task(task_id, timeout)
+    if not task:
+        raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
+    
+    return json_response(task_json(task))
 
 
 @router.get("/tasks", response_model=List[TaskResponse])
@@ -105,45 +173,45 @@ async def list_tasks(
     limit: int = 100
 ):
     """List all tasks, optionally filtered by status"""
-    tasks = await _queue.get_all_tasks(status)
-    tasks = sorted(tasks, key=lambda t: t.created_at, reverse=True)[:limit]
-    return [TaskResponse(**t.to_dict()) for t in tasks]
+    tasks = await _queue.get_all_tasks(status, limit)
+    # Newest first
+    tasks = heapq.nlargest(limit, tasks, key=lambda t: t.created_at)
+    return json_array_stream(task_json(t) for t in tasks)
 
 
 @router.get("/tasks/status/pending", response_model=List[TaskResponse])
-async def get_pending_tasks():
+async def get_pending_tasks(limit: Optional[int] = None):
     """Get all pending/queued tasks"""
-    tasks = await _queue.get_pending_tasks()
-    return [TaskResponse(**t.to_dict()) for t in tasks]
+    tasks = await _queue.get_pending_tasks(limit)
+    return json_response([task_json(t) for t in tasks])
 
 
 @router.get("/tasks/status/completed", response_model=List[TaskResponse])
-async def get_completed_tasks():
+async def get_completed_tasks(limit: Optional[int] = None):
     """Get all completed tasks"""
-    tasks = await _queue.get_completed_tasks()
-    return [TaskResponse(**t.to_dict()) for t in tasks]
+    tasks = await _queue.get_completed_tasks(limit)
+    return json_response([task_json(t) for t in tasks])
 
 
 @router.get("/tasks/status/failed", response_model=List[TaskResponse])
-async def get_failed_tasks():
+async def get_failed_tasks(limit: Optional[int] = None):
     """Get all failed tasks"""
-    tasks = await _queue.get_failed_tasks()
-    return [TaskResponse(**t.to_dict()) for t in tasks]
+    tasks = await _queue.get_failed_tasks(limit)
+    return json_response([task_json(t) for t in tasks])
 
 
 # Periodic task endpoints
 @router.post("/periodic-tasks", status_code=201)
 async def create_periodic_task(periodic_task: PeriodicTaskCreate):
     """Create a new periodic task"""
-    try:
-        task_registry.get(periodic_task.func_name)
-    except KeyError:
+    if periodic_task.func_name not in task_registry:
         raise HTTPException(
             status_code=404,
             detail=f"Task function '{periodic_task.func_name}' not found"
         )
     
     try:
+        # Raises ValueError for an invalid cron expression
         _scheduler.add_periodic_task(
             name=periodic_task.name,
             func_name=periodic_task.func_name,
@@ -207,22 +275,32 @@ async def delete_periodic_task(name: str):
 @router.get("/registered-tasks")
 async def list_registered_tasks():
     """List all registered task functions"""
-    return {"tasks": task_registry.list_tasks()}
+    return json_response({"tasks": task_registry.list_tasks()})
 
 
 @router.get("/metrics")
 async def get_metrics():
-    """Get system metrics"""
+    """Get system metrics (cached for METRICS_TTL seconds)"""
+    global _metrics_cache
+    now = time.monotonic()
+    cached_at, cached = _metrics_cache
+    if cached is not None and now - cached_at < METRICS_TTL:
+        return cached
+    
     queue_metrics = await _queue.get_metrics()
     
-    return {
+    metrics = {
         "queue": queue_metrics,
         "timestamp": datetime.utcnow().isoformat(),
     }
+    _metrics_cache = (now, metrics)
+    return metrics
 
 
 @router.post("/system/clear-queue")
 async def clear_queue():
     """Clear all tasks from queue (use with caution!)"""
+    global _metrics_cache
     await _queue.clear()
+    _metrics_cache = (0.0, None)
     return {"message": "Queue cleared"}
\ No newline at end of file
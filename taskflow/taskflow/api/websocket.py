@@ -2,9 +2,9 @@
 
 from fastapi import WebSocket, WebSocketDisconnect
 from typing import Set, Dict
-import json
 import asyncio
 import logging
+from .encoding import dumps, task_json
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +15,7 @@ class ConnectionManager:
     def __init__(self):
         self.active_connections: Set[WebSocket] = set()
         self.subscriptions: Dict[str, Set[WebSocket]] = {}  # task_id -> connections
+        self.ws_subs: Dict[WebSocket, Set[str]] = {}  # connection -> task_ids
     
     async def connect(self, websocket: WebSocket):
         """Accept new WebSocket connection"""
@@ -26,19 +27,21 @@ class ConnectionManager:
         """Remove WebSocket connection"""
         self.active_connections.discard(websocket)
         
-        # Remove from all subscriptions
-        for task_id in list(self.subscriptions.keys()):
-            self.subscriptions[task_id].discard(websocket)
-            if not self.subscriptions[task_id]:
+        # Remove from this connection's subscriptions only
+        for task_id in self.ws_subs.pop(websocket, ()):
+            subscribers = self.subscriptions.get(task_id)
+            if subscribers is None:
+                continue
+            subscribers.discard(websocket)
+            if not subscribers:
                 del self.subscriptions[task_id]
         
         logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
     
     def subscribe(self, websocket: WebSocket, task_id: str):
         """Subscribe connection to specific task updates"""
-        if task_id not in self.subscriptions:
-            self.subscriptions[task_id] = set()
-        self.subscriptions[task_id].add(websocket)
+        self.subscriptions.setdefault(task_id, set()).add(websocket)
+        self.ws_subs.setdefault(websocket, set()).add(task_id)
         logger.debug(f"WebSocket subscribed to task {task_id}")
     
     def unsubscribe(self, websocket: WebSocket, task_id: str):
@@ -47,6 +50,12 @@ class ConnectionManager:
             self.subscriptions[task_id].discard(websocket)
             if not self.subscriptions[task_id]:
                 del self.subscriptions[task_id]
+        
+        task_ids = self.ws_subs.get(websocket)
+        if task_ids is not None:
+            task_ids.discard(task_id)
+            if not task_ids:
+                del self.ws_subs[websocket]
         logger.debug(f"WebSocket unsubscribed from task {task_id}")
     
     async def send_personal_message(self, message: dict, websocket: WebSocket):
@@ -57,38 +66,53 @@ class ConnectionManager:
             logger.error(f"Error sending personal message: {e}")
             self.disconnect(websocket)
     
-    async def broadcast(self, message: dict):
-        """Broadcast message to all connections"""
-        disconnected = []
+    async def _send_raw(self, connections, frame: bytes):
+        """Send a pre-encoded JSON frame to many connections concurrently"""
+        connections = list(connections)
+        if not connections:
+            return
         
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting to connection: {e}")
-                disconnected.append(connection)
+        # Decode once and send as a text frame; browser clients JSON.parse event.data
+        payload = frame.decode()
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in connections),
+            return_exceptions=True
+        )
         
         # Clean up disconnected clients
-        for connection in disconnected:
-            self.disconnect(connection)
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error sending to connection: {result}")
+                self.disconnect(connection)
     
-    async def send_to_task_subscribers(self, task_id: str, message: dict):
-        """Send message to all connections subscribed to a specific task"""
+    async def broadcast_raw(self, frame: bytes):
+        """Broadcast a pre-encoded JSON frame to all connections"""
+        await self._send_raw(self.active_connections, frame)
+    
+    async def broadcast(self, message: dict):
+        """Broadcast message to all connections"""
+        await self.broadcast_raw(dumps(message))
+    
+    async def publish_raw(self, task_id: str, frame: bytes):
+        """Send a task's pre-encoded frame once to each of its subscribers and dashboards
+        
+        Subscribers are usually also in active_connections; the set union
+        makes sure nobody gets the same event twice.
+        """
+        targets = set(self.active_connections)
+        targets.update(self.subscriptions.get(task_id, ()))
+        await self._send_raw(targets, frame)
+    
+    async def send_raw_to_task_subscribers(self, task_id: str, frame: bytes):
+        """Send a pre-encoded JSON frame to all subscribers of a specific task"""
         if task_id not in self.subscriptions:
             return
         
-        disconnected = []
-        
-        for connection in self.subscriptions[task_id]:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error sending to subscriber: {e}")
-                disconnected.append(connection)
-        
-        # Clean up disconnected clients
-        for connection in disconnected:
-            self.disconnect(connection)
+        await self._send_raw(self.subscriptions[task_id], frame)
+    
+    async def send_to_task_subscribers(self, task_id: str, message: dict):
+        """Send message to all connections subscribed to a specific task"""
+        await self.send_raw_to_task_subscribers(task_id, dumps(message))
     
     def get_stats(self) -> dict:
         """Get connection statistics"""
@@ -103,22 +127,20 @@ class ConnectionManager:
 manager = ConnectionManager()
 
 
-async def task_event_handler(event_type: str, task):
+async def task_event_handler(event_type: str, task, data: dict):
     """Handle task events and broadcast to WebSocket clients
     
-    This is called by WorkerPool when task events occur
+    This is called by WorkerPool when task events occur, with `data` the
+    task's dict as of the event
     """
     message = {
         'type': event_type,
-        'task': task.to_dict(),
-        'timestamp': task.completed_at.isoformat() if task.completed_at else task.created_at.isoformat(),
+        'task': task_json(task, data),
+        'timestamp': data['completed_at'] or data['created_at'],
     }
     
-    # Send to task-specific subscribers
-    await manager.send_to_task_subscribers(task.task_id, message)
-    
-    # Also broadcast to all connections for dashboard
-    await manager.broadcast(message)
+    # Encode once, send once to task subscribers and dashboard connections
+    await manager.publish_raw(data['task_id'], dumps(message))
 
 
 async def websocket_endpoint(websocket: WebSocket):
@@ -136,7 +158,16 @@ async def websocket_endpoint(websocket: WebSocket):
             if message_type == 'subscribe':
                 # Subscribe to specific task updates
                 task_id = data.get('task_id')
-                if task_id:
+                task_ids = data.get('task_ids')
+                if isinstance(task_ids, list) and task_ids:
+                    # Batch form: one message and one ack for many tasks
+                    for tid in task_ids:
+                        manager.subscribe(websocket, tid)
+                    await manager.send_personal_message(
+                        {'type': 'subscribed', 'task_ids': task_ids},
+                        websocket
+                    )
+                elif task_id:
                     manager.subscribe(websocket, task_id)
                     await manager.send_personal_message(
                         {'type': 'subscribed', 'task_id': task_id},
@@ -146,7 +177,15 @@ async def websocket_endpoint(websocket: WebSocket):
             elif message_type == 'unsubscribe':
                 # Unsubscribe from task updates
                 task_id = data.get('task_id')
-                if task_id:
+                task_ids = data.get('task_ids')
+                if isinstance(task_ids, list) and task_ids:
+                    for tid in task_ids:
+                        manager.unsubscribe(websocket, tid)
+                    await manager.send_personal_message(
+                        {'type': 'unsubscribed', 'task_ids': task_ids},
+                        websocket
+                    )
+                elif task_id:
                     manager.unsubscribe(websocket, task_id)
                     await manager.send_personal_message(
                         {'type': 'unsubscribed', 'task_id': task_id},
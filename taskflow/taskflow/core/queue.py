@@ -1,21 +1,63 @@
 # taskflow/core/queue.py
 
 import asyncio
-from queue import PriorityQueue, Empty
-from typing import Optional, Dict, List
+from collections import OrderedDict, deque
+from typing import Deque, Optional, Dict, List
 from datetime import datetime
+import itertools
 import logging
-from .task import Task, TaskStatus
+from .task import Task, TaskStatus, TaskPriority, TERMINAL_STATUSES
+from .registry import task_registry
 
 logger = logging.getLogger(__name__)
 
 
+def _tail(tasks: Dict[str, Task], limit: Optional[int]) -> List[Task]:
+    """Last `limit` values of an insertion-ordered mapping, oldest first"""
+    if limit is None:
+        return list(tasks.values())
+    tail = list(itertools.islice(reversed(tasks.values()), max(limit, 0)))
+    tail.reverse()
+    return tail
+
+
+_NUM_LANES = len(TaskPriority)
+
+
+def _lane_for(priority: int) -> int:
+    """Lane index for a priority; values outside CRITICAL..LOW use the nearest lane"""
+    return min(max(priority, 0), _NUM_LANES - 1)
+
+
 class TaskQueue:
-    """Thread-safe priority queue for tasks"""
+    """Asyncio priority queue for tasks
+    
+    Each TaskPriority has its own FIFO lane; dequeue takes from the highest
+    priority non-empty lane. Enqueue/dequeue and the task lookups never await
+    between checking and mutating state, so they need no lock on a single
+    event loop; only clear() takes it.
+    
+    All methods must be called from the event loop that runs the workers.
+    """
     
-    def __init__(self, maxsize: int = 0):
-        self._queue = PriorityQueue(maxsize=maxsize)
-        self._tasks: Dict[str, Task] = {}  # task_id -> Task
+    def __init__(self, maxsize: int = 0, history_size: int = 10000):
+        self._maxsize = maxsize
+        self._history_size = history_size
+        self._lanes: List[Deque[Task]] = [deque() for _ in range(_NUM_LANES)]
+        self._size = 0  # Total tasks across all lanes
+        self._not_empty = asyncio.Event()
+        self._wakeups = 0  # Bumped by wake_waiters()
+        # task_id -> Task for every retained task, in order first enqueued
+        self._tasks: Dict[str, Task] = {}
+        # Finished tasks in order of finishing, oldest evicted first once
+        # over history_size
+        self._history: OrderedDict[str, Task] = OrderedDict()
+        # Set when the task finishes; only created for tasks someone waits on
+        self._done_events: Dict[str, asyncio.Event] = {}
+        # status -> task_id -> Task, in order of entering that status
+        self._by_status: Dict[TaskStatus, OrderedDict[str, Task]] = {
+            status: OrderedDict() for status in TaskStatus
+        }
         self._lock = asyncio.Lock()
         self._metrics = {
             'total_enqueued': 0,
@@ -23,6 +65,50 @@ class TaskQueue:
             'current_size': 0,
         }
     
+    def _index(self, task: Task):
+        """Move task into the bucket for its current status"""
+        bucket = self._by_status[task.status]
+        if task.task_id in bucket:
+            return
+        for other in self._by_status.values():
+            other.pop(task.task_id, None)
+        bucket[task.task_id] = task
+        if task.status in TERMINAL_STATUSES:
+            self._retire(task)
+    
+    def _retire(self, task: Task):
+        """Record a finished task in the bounded history"""
+        self._history[task.task_id] = task
+        event = self._done_events.pop(task.task_id, None)
+        if event is not None:
+            event.set()
+        while len(self._history) > self._history_size:
+            _, old = self._history.popitem(last=False)
+            self._tasks.pop(old.task_id, None)
+            self._by_status[old.status].pop(old.task_id, None)
+    
+    def _push(self, task: Task, front: bool = False):
+        if task.func is None:
+            # None if unregistered; the worker reports that as a failure
+            task.func = task_registry.get(task.func_name)
+        self._tasks[task.task_id] = task
+        task._on_status_change = self._index
+        task.mark_queued()
+        lane = self._lanes[_lane_for(task.priority)]
+        if front:
+            lane.appendleft(task)
+        else:
+            lane.append(task)
+        self._size += 1
+    
+    def _pop(self) -> Optional[Task]:
+        for lane in self._lanes:
+            if lane:
+                self._size -= 1
+                return lane.popleft()
+        self._not_empty.clear()
+        return None
+    
     async def enqueue(self, task: Task) -> bool:
         """Add a task to the queue
         
@@ -30,112 +116,219 @@ class TaskQueue:
             bool: True if task was added, False if queue is full
         """
         try:
-            async with self._lock:
-                # Store task reference
-                self._tasks[task.task_id] = task
-                
-                # Add to priority queue
-                task.mark_queued()
-                self._queue.put(task)
-                
-                # Update metrics
-                self._metrics['total_enqueued'] += 1
-                self._metrics['current_size'] = self._queue.qsize()
-                
-                logger.info(f"Enqueued task {task.task_id} ({task.func_name}) with priority {task.priority}")
-                return True
-                
+            if self._maxsize > 0 and self.size() >= self._maxsize:
+                logger.warning(f"Queue full, rejected task {task.task_id}")
+                return False
+            
+            self._push(task)
+            self._not_empty.set()
+            
+            # Update metrics
+            self._metrics['total_enqueued'] += 1
+            self._metrics['current_size'] = self.size()
+            
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Enqueued task %s (%s) with priority %d", task.task_id, task.func_name, task.priority)
+            return True
+            
         except Exception as e:
             logger.error(f"Failed to enqueue task {task.task_id}: {e}")
             return False
     
-    async def dequeue(self, timeout: float = 1.0) -> Optional[Task]:
-        """Get the highest priority task from the queue
+    async def enqueue_many(self, tasks: List[Task]) -> bool:
+        """Add several tasks to the queue, waking waiting workers once
         
-        Args:
-            timeout: How long to wait for a task (seconds)
-            
         Returns:
-            Task or None if queue is empty
+            bool: True if all tasks were added, False otherwise
         """
         try:
-            # Run blocking queue.get in thread pool to avoid blocking event loop
-            loop = asyncio.get_event_loop()
-            task = await loop.run_in_executor(
-                None, 
-                lambda: self._queue.get(timeout=timeout)
-            )
+            if self._maxsize > 0 and self.size() + len(tasks) > self._maxsize:
+                logger.warning(f"Queue full, rejected batch of {len(tasks)} tasks")
+                return False
             
-            async with self._lock:
-                self._metrics['total_dequeued'] += 1
-                self._metrics['current_size'] = self._queue.qsize()
+            for task in tasks:
+                self._push(task)
+            if tasks:
+                self._not_empty.set()
             
-            logger.debug(f"Dequeued task {task.task_id}")
-            return task
+            # Update metrics once for the whole batch
+            self._metrics['total_enqueued'] += len(tasks)
+            self._metrics['current_size'] = self.size()
+            
+            logger.info("Enqueued %d tasks", len(tasks))
+            return True
             
-        except Empty:
-            return None
         except Exception as e:
-            logger.error(f"Error dequeuing task: {e}")
-            return None
+            logger.error(f"Failed to enqueue batch of {len(tasks)} tasks: {e}")
+            return False
+    
+    async def requeue(self, tasks: List[Task]):
+        """Put dequeued but unstarted tasks back at the front of their lanes
+        
+        Undoes their dequeue in the metrics rather than counting them as
+        enqueued again.
+        """
+        for task in reversed(tasks):
+            self._push(task, front=True)
+        if tasks:
+            self._not_empty.set()
+        
+        self._metrics['total_dequeued'] -= len(tasks)
+        self._metrics['current_size'] = self.size()
+    
+    async def dequeue(self, timeout: Optional[float] = 1.0) -> Optional[Task]:
+        """Get the highest priority task from the queue
+        
+        Args:
+            timeout: How long to wait for a task (seconds); None waits until a
+                task arrives or wake_waiters() is called
+            
+        Returns:
+            Task or None if queue is empty
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        wakeups = self._wakeups
+        
+        task = self._pop()
+        while task is None:
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return None
+            try:
+                await asyncio.wait_for(self._not_empty.wait(), remaining)
+            except asyncio.TimeoutError:
+                return None
+            # Another waiter may have taken it first
+            task = self._pop()
+            if task is None and self._wakeups != wakeups:
+                return None
+        
+        self._metrics['total_dequeued'] += 1
+        self._metrics['current_size'] = self.size()
+        
+        logger.debug("Dequeued task %s", task.task_id)
+        return task
+    
+    async def dequeue_many(self, n: int, timeout: Optional[float] = 1.0) -> List[Task]:
+        """Get up to `n` tasks, highest priority first
+        
+        Waits for the first task like dequeue(); the rest are only taken if
+        already queued.
+        """
+        task = await self.dequeue(timeout)
+        if task is None:
+            return []
+        
+        tasks = [task]
+        while len(tasks) < n:
+            task = self._pop()
+            if task is None:
+                break
+            tasks.append(task)
+        
+        self._metrics['total_dequeued'] += len(tasks) - 1
+        self._metrics['current_size'] = self.size()
+        return tasks
     
     async def get_task(self, task_id: str) -> Optional[Task]:
         """Get task by ID"""
-        async with self._lock:
-            return self._tasks.get(task_id)
+        return self._tasks.get(task_id)
+    
+    async def wait_for_task(self, task_id: str, timeout: float) -> Optional[Task]:
+        """Get a task once it has finished, or as it is after `timeout` seconds
+        
+        Returns:
+            Task or None if no such task
+        """
+        task = await self.get_task(task_id)
+        if task is None or task.status in TERMINAL_STATUSES:
+            return task
+        
+        event = self._done_events.get(task_id)
+        if event is None:
+            event = self._done_events[task_id] = asyncio.Event()
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return await self.get_task(task_id)
     
     async def update_task(self, task: Task):
         """Update task in storage"""
-        async with self._lock:
-            self._tasks[task.task_id] = task
+        # Stored tasks are shared objects that the status index follows, so
+        # there is nothing to copy. Tasks dropped by clear() or evicted from
+        # history stay gone; a retry re-adds its task when it is enqueued.
     
-    async def get_all_tasks(self, status: Optional[TaskStatus] = None) -> List[Task]:
-        """Get all tasks, optionally filtered by status"""
-        async with self._lock:
-            tasks = list(self._tasks.values())
-            if status:
-                tasks = [t for t in tasks if t.status == status]
-            return tasks
+    async def get_all_tasks(
+        self,
+        status: Optional[TaskStatus] = None,
+        limit: Optional[int] = None,
+    ) -> List[Task]:
+        """Get all tasks, optionally filtered by status
+        
+        Args:
+            status: Only return tasks currently in this status
+            limit: Only return the most recently added tasks (most recent
+                to enter `status` when filtering)
+        """
+        if status:
+            return _tail(self._by_status[status], limit)
+        return _tail(self._tasks, limit)
     
-    async def get_pending_tasks(self) -> List[Task]:
+    async def get_pending_tasks(self, limit: Optional[int] = None) -> List[Task]:
         """Get tasks waiting to be executed"""
-        return await self.get_all_tasks(TaskStatus.QUEUED)
+        return await self.get_all_tasks(TaskStatus.QUEUED, limit)
     
-    async def get_completed_tasks(self) -> List[Task]:
+    async def get_completed_tasks(self, limit: Optional[int] = None) -> List[Task]:
         """Get successfully completed tasks"""
-        return await self.get_all_tasks(TaskStatus.COMPLETED)
+        return await self.get_all_tasks(TaskStatus.COMPLETED, limit)
     
-    async def get_failed_tasks(self) -> List[Task]:
+    async def get_failed_tasks(self, limit: Optional[int] = None) -> List[Task]:
         """Get failed tasks"""
-        return await self.get_all_tasks(TaskStatus.FAILED)
+        return await self.get_all_tasks(TaskStatus.FAILED, limit)
+    
+    def wake_waiters(self):
+        """Make every dequeue() currently waiting return, with None if no task is left"""
+        self._wakeups += 1
+        self._not_empty.set()
     
     def size(self) -> int:
         """Get current queue size"""
-        return self._queue.qsize()
+        return self._size
     
     def is_empty(self) -> bool:
         """Check if queue is empty"""
-        return self._queue.empty()
+        return self._size == 0
     
     async def get_metrics(self) -> dict:
         """Get queue metrics"""
-        async with self._lock:
-            return {
-                **self._metrics,
-                'pending_count': len([t for t in self._tasks.values() if t.status == TaskStatus.QUEUED]),
-                'running_count': len([t for t in self._tasks.values() if t.status == TaskStatus.RUNNING]),
-                'completed_count': len([t for t in self._tasks.values() if t.status == TaskStatus.COMPLETED]),
-                'failed_count': len([t for t in self._tasks.values() if t.status == TaskStatus.FAILED]),
-            }
+        by_status = self._by_status
+        return {
+            **self._metrics,
+            'pending_count': len(by_status[TaskStatus.QUEUED]),
+            'running_count': len(by_status[TaskStatus.RUNNING]),
+            'completed_count': len(by_status[TaskStatus.COMPLETED]),
+            'failed_count': len(by_status[TaskStatus.FAILED]),
+        }
     
     async def clear(self):
         """Clear all tasks from queue"""
         async with self._lock:
-            while not self._queue.empty():
-                try:
-                    self._queue.get_nowait()
-                except Empty:
-                    break
+            for lane in self._lanes:
+                lane.clear()
+            self._size = 0
+            self._not_empty.clear()
+            # Workers may still hold running tasks; detach every task so
+            # their later status changes don't reach the emptied indexes
+            for task in self._tasks.values():
+                task._on_status_change = None
+            self._history.clear()
             self._tasks.clear()
+            for event in self._done_events.values():
+                event.set()
+            self._done_events.clear()
+            for bucket in self._by_status.values():
+                bucket.clear()
             self._metrics['current_size'] = 0
             logger.info("Queue cleared")
\ No newline at end of file
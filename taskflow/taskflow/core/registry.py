@@ -1,19 +1,24 @@
 # taskflow/core/registry.py
 
-from typing import Callable, Dict
-import functools
+from typing import Callable, Dict, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Execution modes: "io" runs in the worker thread pool, "cpu" in a process pool
+TASK_MODES = ("io", "cpu")
+
 
 class TaskRegistry:
     """Registry to store and retrieve task functions"""
     
     def __init__(self):
         self._tasks: Dict[str, Callable] = {}
+        self._modes: Dict[str, str] = {}  # Only tasks not in "io" mode
+        self._version = 0  # Bumped on every (un)registration
+        self._names_cache: Optional[Tuple[str, ...]] = None
     
-    def register(self, name: str = None):
+    def register(self, name: str = None, mode: str = "io"):
         """Decorator to register a function as a task
         
         Usage:
@@ -24,7 +29,16 @@ class TaskRegistry:
             @task_registry.register("custom_name")
             def another_task():
                 pass
+            
+            # CPU-bound: run in a worker process. The function, its
+            # arguments and result must be picklable.
+            @task_registry.register(mode="cpu")
+            def crunch(n):
+                return sum(i * i for i in range(n))
         """
+        if mode not in TASK_MODES:
+            raise ValueError(f"Invalid task mode '{mode}', expected one of {TASK_MODES}")
+        
         def decorator(func: Callable) -> Callable:
             task_name = name or func.__name__
             
@@ -32,32 +46,53 @@ class TaskRegistry:
                 logger.warning(f"Task '{task_name}' is already registered. Overwriting.")
             
             self._tasks[task_name] = func
+            if mode == "io":
+                self._modes.pop(task_name, None)
+            else:
+                self._modes[task_name] = mode
+            self._version += 1
+            self._names_cache = None
             logger.info(f"Registered task: {task_name}")
             
-            @functools.wraps(func)
-            def wrapper(*args, **kwargs):
-                return func(*args, **kwargs)
-            
             # Store the task name on the function for reference
-            wrapper.task_name = task_name
-            return wrapper
+            func.task_name = task_name
+            return func
         
         return decorator
     
-    def get(self, name: str) -> Callable:
-        """Get a registered task function by name"""
-        if name not in self._tasks:
-            raise KeyError(f"Task '{name}' not found in registry")
-        return self._tasks[name]
+    def __contains__(self, name: str) -> bool:
+        """Check whether a task function is registered"""
+        return name in self._tasks
+    
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever the set of registered tasks changes"""
+        return self._version
     
-    def list_tasks(self) -> list[str]:
-        """List all registered task names"""
-        return list(self._tasks.keys())
+    def get(self, name: str) -> Optional[Callable]:
+        """Get a registered task function by name, or None if there is none"""
+        return self._tasks.get(name)
+    
+    def mode(self, name: str) -> str:
+        """Execution mode a task was registered with ("io" or "cpu")"""
+        return self._modes.get(name, "io")
+    
+    def list_tasks(self) -> Tuple[str, ...]:
+        """List all registered task names, in registration order
+        
+        The tuple is cached until the next (un)registration.
+        """
+        if self._names_cache is None:
+            self._names_cache = tuple(self._tasks)
+        return self._names_cache
     
     def unregister(self, name: str) -> bool:
         """Remove a task from the registry"""
         if name in self._tasks:
             del self._tasks[name]
+            self._modes.pop(name, None)
+            self._version += 1
+            self._names_cache = None
             logger.info(f"Unregistered task: {name}")
             return True
         return False
@@ -68,7 +103,7 @@ task_registry = TaskRegistry()
 
 
 # Convenience decorator using global registry
-def task(name: str = None):
+def task(name: str = None, mode: str = "io"):
     """Convenience decorator for registering tasks
     
     Usage:
@@ -76,4 +111,4 @@ def task(name: str = None):
         def process_data(data):
             return data.upper()
     """
-    return task_registry.register(name)
\ No newline at end of file
+    return task_registry.register(name, mode)
\ No newline at end of file
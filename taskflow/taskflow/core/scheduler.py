@@ -2,10 +2,13 @@
 
 import asyncio
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
+import heapq
 import logging
+import time
 from croniter import croniter
-from .task import Task, TaskPriority
+from .task import Task, NORMAL
+from .task_pool import task_pool
 from .queue import TaskQueue
 
 logger = logging.getLogger(__name__)
@@ -20,7 +23,7 @@ class PeriodicTask:
         cron_expression: str,
         args: tuple = (),
         kwargs: dict = None,
-        priority: int = TaskPriority.NORMAL.value,
+        priority: int = NORMAL,
         max_retries: int = 3,
         timeout: Optional[int] = None,
         enabled: bool = True
@@ -34,31 +37,44 @@ class PeriodicTask:
         self.timeout = timeout
         self.enabled = enabled
         
-        # Validate cron expression
+        # Parsed once here; this iterator validates the expression and
+        # serves every later next-run calculation
         try:
-            croniter(cron_expression)
+            self._cron_iter = croniter(cron_expression, datetime.now())
         except Exception as e:
             raise ValueError(f"Invalid cron expression '{cron_expression}': {e}")
         
-        self.next_run = self._calculate_next_run()
+        # next_run is for display; the scheduler waits on the monotonic
+        # next_run_at so wall-clock adjustments don't affect the sleep
+        self.reschedule()
         self.last_run: Optional[datetime] = None
         self.run_count = 0
     
-    def _calculate_next_run(self) -> datetime:
+    def _calculate_next_run(self, now: datetime) -> datetime:
         """Calculate next run time based on cron expression"""
+        next_run = self._cron_iter.get_next(datetime)
+        if next_run <= now:
+            # Runs were missed (e.g. while disabled); skip to the next one
+            # after now rather than firing the backlog
+            self._cron_iter.set_current(now)
+            next_run = self._cron_iter.get_next(datetime)
+        return next_run
+    
+    def reschedule(self):
+        """Move next_run/next_run_at to the next cron occurrence"""
         now = datetime.now()
-        cron = croniter(self.cron_expression, now)
-        return cron.get_next(datetime)
+        self.next_run = self._calculate_next_run(now)
+        self.next_run_at = time.monotonic() + (self.next_run - now).total_seconds()
     
     def should_run(self) -> bool:
         """Check if task should run now"""
         if not self.enabled:
             return False
-        return datetime.now() >= self.next_run
+        return time.monotonic() >= self.next_run_at
     
     def create_task_instance(self) -> Task:
         """Create a Task instance for this periodic task"""
-        return Task(
+        return task_pool.acquire(
             func_name=self.func_name,
             args=self.args,
             kwargs=self.kwargs,
@@ -72,8 +88,9 @@ class PeriodicTask:
         """Mark that task was executed and calculate next run"""
         self.last_run = datetime.now()
         self.run_count += 1
-        self.next_run = self._calculate_next_run()
-        logger.info(f"Periodic task '{self.func_name}' executed. Next run: {self.next_run}")
+        self.reschedule()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Periodic task '%s' executed. Next run: %s", self.func_name, self.next_run)
 
 
 class TaskScheduler:
@@ -82,6 +99,10 @@ class TaskScheduler:
     def __init__(self, queue: TaskQueue):
         self.queue = queue
         self.periodic_tasks: Dict[str, PeriodicTask] = {}
+        # (next_run_at, name) min-heap; entries whose deadline no longer
+        # matches the task's are stale and skipped when popped
+        self._heap: List[Tuple[float, str]] = []
+        self._wakeup = asyncio.Event()
         self.running = False
         self._scheduler_task = None
         logger.info("Task scheduler initialized")
@@ -93,7 +114,7 @@ class TaskScheduler:
         cron_expression: str,
         args: tuple = (),
         kwargs: dict = None,
-        priority: int = TaskPriority.NORMAL.value,
+        priority: int = NORMAL,
         max_retries: int = 3,
         timeout: Optional[int] = None,
     ) -> PeriodicTask:
@@ -131,6 +152,9 @@ class TaskScheduler:
         )
         
         self.periodic_tasks[name] = periodic_task
+        heapq.heappush(self._heap, (periodic_task.next_run_at, name))
+        self._compact_heap()
+        self._wakeup.set()
         logger.info(f"Added periodic task '{name}' with schedule '{cron_expression}'")
         return periodic_task
     
@@ -138,10 +162,23 @@ class TaskScheduler:
         """Remove a periodic task"""
         if name in self.periodic_tasks:
             del self.periodic_tasks[name]
+            self._compact_heap()
             logger.info(f"Removed periodic task '{name}'")
             return True
         return False
     
+    def _compact_heap(self):
+        """Rebuild the heap once stale entries outnumber live ones
+        
+        Entries for removed or replaced tasks are otherwise only dropped when
+        their deadline comes up, which for e.g. monthly schedules lets them
+        pile up under add/remove churn.
+        """
+        if len(self._heap) <= 2 * len(self.periodic_tasks):
+            return
+        self._heap = [(task.next_run_at, name) for name, task in self.periodic_tasks.items()]
+        heapq.heapify(self._heap)
+    
     def get_periodic_task(self, name: str) -> Optional[PeriodicTask]:
         """Get a periodic task by name"""
         return self.periodic_tasks.get(name)
@@ -190,22 +227,46 @@ class TaskScheduler:
         
         while self.running:
             try:
-                now = datetime.now()
+                now = time.monotonic()
+                
+                # Collect every periodic task whose deadline has passed
+                due = []
+                while self._heap and self._heap[0][0] <= now:
+                    deadline, name = heapq.heappop(self._heap)
+                    periodic_task = self.periodic_tasks.get(name)
+                    if periodic_task is None or periodic_task.next_run_at != deadline:
+                        continue  # removed or replaced since this entry was pushed
+                    due.append((name, periodic_task))
                 
-                # Check each periodic task
-                for name, periodic_task in list(self.periodic_tasks.items()):
-                    if periodic_task.should_run():
-                        # Create task instance and enqueue
-                        task = periodic_task.create_task_instance()
-                        await self.queue.enqueue(task)
-                        
+                if due:
+                    # Enqueue this tick's instances as one batch
+                    ready = [
+                        (name, periodic_task, periodic_task.create_task_instance())
+                        for name, periodic_task in due
+                        if periodic_task.enabled
+                    ]
+                    if ready:
+                        await self.queue.enqueue_many([task for _, _, task in ready])
+                    
+                    log_info = logger.isEnabledFor(logging.INFO)
+                    for name, periodic_task, task in ready:
                         # Mark as executed
                         periodic_task.mark_executed()
-                        
-                        logger.info(f"Scheduled periodic task '{name}' (task_id: {task.task_id})")
+                        if log_info:
+                            logger.info("Scheduled periodic task '%s' (task_id: %s)", name, task.task_id)
+                    
+                    for name, periodic_task in due:
+                        if not periodic_task.enabled:
+                            periodic_task.reschedule()
+                        heapq.heappush(self._heap, (periodic_task.next_run_at, name))
                 
-                # Sleep for a bit before next check
-                await asyncio.sleep(1)  # Check every second
+                # Sleep until the next deadline, or until a task is added
+                self._wakeup.clear()
+                timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
                 
             except Exception as e:
                 logger.error(f"Error in scheduler loop: {e}", exc_info=True)
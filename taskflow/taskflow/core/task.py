@@ -4,7 +4,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, UTC
 from enum import Enum
 from typing import Any, Optional, Callable
-import uuid
+import time
+from .uuid_pool import uuid_pool
 
 
 class TaskStatus(str, Enum):
@@ -17,6 +18,17 @@ class TaskStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+# States a task never leaves once reached
+TERMINAL_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED})
+
+
+def _isoformat(timestamp: Optional[float]) -> Optional[str]:
+    """ISO 8601 UTC string for a time.time() timestamp"""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, UTC).isoformat()
+
+
 class TaskPriority(int, Enum):
     LOW = 3
     NORMAL = 2
@@ -24,69 +36,115 @@ class TaskPriority(int, Enum):
     CRITICAL = 0
 
 
-@dataclass(order=True)
+# Plain-int priorities for internal use; Task.priority is always stored as one
+CRITICAL, HIGH, NORMAL, LOW = 0, 1, 2, 3
+
+
+@dataclass(eq=False, slots=True)
 class Task:
     """Represents a task to be executed"""
     
-    # Priority first for sorting in PriorityQueue
-    priority: int = field(compare=True)
+    priority: int
     
     # Core fields
-    task_id: str = field(default_factory=lambda: str(uuid.uuid4()), compare=False)
-    func_name: str = field(default="", compare=False)
-    args: tuple = field(default_factory=tuple, compare=False)
-    kwargs: dict = field(default_factory=dict, compare=False)
-    
-    # Metadata
-    status: TaskStatus = field(default=TaskStatus.PENDING, compare=False)
-    created_at: datetime = field(default_factory=datetime.utcnow, compare=False)
-    scheduled_at: Optional[datetime] = field(default=None, compare=False)
-    started_at: Optional[datetime] = field(default=None, compare=False)
-    completed_at: Optional[datetime] = field(default=None, compare=False)
+    task_id: str = field(default_factory=uuid_pool.next_id)
+    func_name: str = ""
+    args: tuple = field(default_factory=tuple)
+    kwargs: dict = field(default_factory=dict)
+    
+    # Metadata (time.time() timestamps)
+    status: TaskStatus = TaskStatus.PENDING
+    created_at: float = field(default_factory=time.time)
+    scheduled_at: Optional[float] = None
+    started_at: Optional[float] = None
+    completed_at: Optional[float] = None
     
     # Execution details
-    result: Any = field(default=None, compare=False)
-    error: Optional[str] = field(default=None, compare=False)
-    retry_count: int = field(default=0, compare=False)
-    max_retries: int = field(default=3, compare=False)
-    timeout: Optional[int] = field(default=None, compare=False)  # seconds
+    result: Any = None
+    error: Optional[str] = None
+    retry_count: int = 0
+    max_retries: int = 3
+    timeout: Optional[int] = None  # seconds
     
     # Dependencies
-    depends_on: list[str] = field(default_factory=list, compare=False)
+    depends_on: list[str] = field(default_factory=list)
     
     # Periodic scheduling
-    cron_expression: Optional[str] = field(default=None, compare=False)
+    cron_expression: Optional[str] = None
+    
+    # Registered function for func_name, resolved by TaskQueue on enqueue
+    func: Optional[Callable] = field(default=None, repr=False)
+    
+    # ISO-formatted timestamps, set alongside the float ones
+    created_at_iso: Optional[str] = field(default=None, init=False, repr=False)
+    started_at_iso: Optional[str] = field(default=None, init=False, repr=False)
+    completed_at_iso: Optional[str] = field(default=None, init=False, repr=False)
+    
+    # Serialized form, kept once the task reaches a terminal state
+    _dict_cache: Optional[dict] = field(default=None, init=False, repr=False)
+    # JSON encoding of that dict, filled in by the API layer on first use;
+    # both are dropped on any status change or reset
+    json_cache: Optional[bytes] = field(default=None, init=False, repr=False)
+    
+    # Called with the task after every status change (set by TaskQueue)
+    _on_status_change: Optional[Callable[["Task"], None]] = field(default=None, init=False, repr=False)
     
     def __post_init__(self):
         if isinstance(self.priority, TaskPriority):
             self.priority = self.priority.value
+        self.created_at_iso = _isoformat(self.created_at)
+    
+    def reset(self, **fields):
+        """Reinitialise in place with `fields`, as if freshly constructed"""
+        self.__init__(**fields)
+    
+    def _set_status(self, status: TaskStatus):
+        self.status = status
+        self._dict_cache = None
+        self.json_cache = None
+        if self._on_status_change is not None:
+            self._on_status_change(self)
     
     def mark_queued(self):
-        self.status = TaskStatus.QUEUED
+        self._set_status(TaskStatus.QUEUED)
     
     def mark_running(self):
-        self.status = TaskStatus.RUNNING
-        self.started_at = datetime.now(UTC)
+        self._set_status(TaskStatus.RUNNING)
+        self.started_at = time.time()
+        self.started_at_iso = _isoformat(self.started_at)
     
     def mark_completed(self, result: Any = None):
-        self.status = TaskStatus.COMPLETED
-        self.completed_at = datetime.now(UTC)
+        self._set_status(TaskStatus.COMPLETED)
+        self.completed_at = time.time()
+        self.completed_at_iso = _isoformat(self.completed_at)
         self.result = result
+        self._dict_cache = self._build_dict()
     
     def mark_failed(self, error: str):
-        self.status = TaskStatus.FAILED
-        self.completed_at = datetime.now(UTC)
+        self._set_status(TaskStatus.FAILED)
+        self.completed_at = time.time()
+        self.completed_at_iso = _isoformat(self.completed_at)
         self.error = error
+        self._dict_cache = self._build_dict()
     
     def mark_retrying(self):
-        self.status = TaskStatus.RETRYING
+        self._set_status(TaskStatus.RETRYING)
         self.retry_count += 1
     
     def can_retry(self) -> bool:
         return self.retry_count < self.max_retries
     
     def to_dict(self) -> dict:
-        """Convert to dictionary for serialization"""
+        """Convert to dictionary for serialization
+        
+        Terminal tasks never change again, so their dict is built once on
+        completion/failure and reused.
+        """
+        if self._dict_cache is not None:
+            return self._dict_cache
+        return self._build_dict()
+    
+    def _build_dict(self) -> dict:
         return {
             'task_id': self.task_id,
             'func_name': self.func_name,
@@ -94,9 +152,9 @@ class Task:
             'kwargs': self.kwargs,
             'status': self.status.value,
             'priority': self.priority,
-            'created_at': self.created_at.isoformat(),
-            'started_at': self.started_at.isoformat() if self.started_at else None,
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+            'created_at': self.created_at_iso,
+            'started_at': self.started_at_iso,
+            'completed_at': self.completed_at_iso,
             'result': self.result,
             'error': self.error,
             'retry_count': self.retry_count,
@@ -0,0 +1,38 @@
+# taskflow/core/task_pool.py
+
+from collections import deque
+from typing import Deque
+from .task import Task
+
+
+class TaskPool:
+    """Free-list of Task objects that are no longer referenced
+    
+    Only release a task once nothing else (queue storage, API responses,
+    workers, pending events) can still see it; a released task is reset and
+    handed out again by the next acquire. TaskQueue never releases: a task
+    dropped from it may still be in an event or a streamed response.
+    """
+    
+    def __init__(self, maxsize: int = 4096):
+        self._free: Deque[Task] = deque(maxlen=maxsize)
+    
+    def acquire(self, **fields) -> Task:
+        """Get a Task initialised with `fields`, reusing a released one if available"""
+        try:
+            task = self._free.pop()
+        except IndexError:
+            return Task(**fields)
+        task.reset(**fields)
+        return task
+    
+    def release(self, task: Task):
+        """Return a task to the pool; extras beyond maxsize are left to the GC"""
+        self._free.append(task)
+    
+    def __len__(self) -> int:
+        return len(self._free)
+
+
+# Global task pool
+task_pool = TaskPool()
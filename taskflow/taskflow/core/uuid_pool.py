@@ -0,0 +1,37 @@
+# taskflow/core/uuid_pool.py
+
+from collections import deque
+from typing import Deque
+import os
+import uuid
+
+
+class UUIDPool:
+    """Pre-generated random (version 4) UUID strings
+    
+    Refills read the randomness for `batch_size` ids with one os.urandom
+    call, instead of one call per id as uuid.uuid4() does.
+    """
+    
+    def __init__(self, batch_size: int = 1024):
+        self._batch_size = batch_size
+        self._ids: Deque[str] = deque()
+    
+    def _refill(self):
+        buf = os.urandom(16 * self._batch_size)
+        self._ids.extend(
+            str(uuid.UUID(bytes=buf[i:i + 16], version=4))
+            for i in range(0, len(buf), 16)
+        )
+    
+    def next_id(self) -> str:
+        """Get an unused uuid4 string"""
+        try:
+            return self._ids.popleft()
+        except IndexError:
+            self._refill()
+            return self._ids.popleft()
+
+
+# Global UUID pool
+uuid_pool = UUIDPool()
@@ -194,17 +194,36 @@
 # taskflow/core/worker.py
 
 import asyncio
+import heapq
+import inspect
+import itertools
 import logging
-from concurrent.futures import ThreadPoolExecutor
-from functools import partial
-from typing import Optional
-
-from .task import Task
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+from .task import Task, TERMINAL_STATUSES
 from .queue import TaskQueue
 from .registry import task_registry
 
 logger = logging.getLogger(__name__)
 
+MAX_RETRY_DELAY = 60  # seconds
+MAX_PENDING_EVENTS = 10000
+MAX_DELAYED_RETRIES = 10000
+
+
+def _takes_snapshot(callback) -> bool:
+    """Whether an event callback accepts (event_type, task, data)"""
+    try:
+        inspect.signature(callback).bind(None, None, None)
+    except (TypeError, ValueError):
+        return False
+    return True
+
 
 class WorkerPool:
     """Manages a pool of workers that execute tasks"""
@@ -214,16 +233,55 @@ class WorkerPool:
         queue: TaskQueue,
         num_workers: int = 4,
         event_callback: Optional[callable] = None,
+        batch_size: int = 1,
+        thread_pool_size: Optional[int] = None,
     ):
         self.queue = queue
         self.num_workers = num_workers
-        self.executor = ThreadPoolExecutor(max_workers=num_workers)
+        # Tasks a worker takes per dequeue; above 1, a queued higher-priority
+        # task can wait behind the rest of a worker's batch
+        self.batch_size = batch_size
+        # Threads are busy for the whole of a blocking call, so I/O-bound
+        # tasks want many more than there are workers; for purely
+        # CPU-bound Python, cpu_count() is enough
+        self.thread_pool_size = thread_pool_size or max(32, num_workers * 4)
+        self.process_pool_size = min(num_workers, os.cpu_count() or 1)
+        self._create_executors()
         self.running = False
         self.workers = []
+        self._active_workers = 0  # Workers currently executing a task
+        # Called as event_callback(event_type, task, data), where data is
+        # task.to_dict() taken when the event happened; callbacks taking
+        # only (event_type, task) are still called that way
         self.event_callback = event_callback
+        self._callback_takes_data = event_callback is not None and _takes_snapshot(event_callback)
+        # Events wait here for one consumer task, so a slow callback
+        # doesn't hold up the workers
+        self._events: asyncio.Queue = asyncio.Queue(maxsize=MAX_PENDING_EVENTS)
+        self._event_consumer: Optional[asyncio.Task] = None
+        # (ready_at, seq, task) min-heap of retries waiting out their backoff,
+        # fed back into the queue by one background task
+        self._delayed: List[Tuple[float, int, Task]] = []
+        self._delayed_seq = itertools.count()
+        self._delayed_wakeup = asyncio.Event()
+        self._delayed_feeder: Optional[asyncio.Task] = None
 
         logger.info(f"Initialized worker pool with {num_workers} workers")
 
+    def _create_executors(self):
+        """Fresh executors and slots; stop() shuts the previous ones down"""
+        self.executor = ThreadPoolExecutor(max_workers=self.thread_pool_size)
+        # Free threads in self.executor. A timed-out task keeps its thread
+        # until it really returns, so new tasks wait here for a free one
+        # instead of timing out in the executor's backlog (likewise
+        # _process_slots for the process pool). Jobs still running from
+        # before a restart release the old semaphore, not these.
+        self._thread_slots = asyncio.Semaphore(self.thread_pool_size)
+        # For "cpu" mode tasks; created on first use, with its own slots
+        self._process_executor: Optional[ProcessPoolExecutor] = None
+        self._process_slots = asyncio.Semaphore(self.process_pool_size)
+        self._executors_shut_down = False
+
     async def start(self):
         if self.running:
             return
@@ -231,6 +289,13 @@ class WorkerPool:
         self.running = True
         logger.info(f"Starting {self.num_workers} workers...")
 
+        if self._executors_shut_down:
+            self._create_executors()
+
+        if self.event_callback:
+            self._event_consumer = asyncio.create_task(self._drain_events())
+        self._delayed_feeder = asyncio.create_task(self._feed_delayed())
+
         self.workers = [
             asyncio.create_task(self._worker_loop(i))
             for i in range(self.num_workers)
@@ -238,28 +303,75 @@ class WorkerPool:
 
         logger.info("Worker pool started")
 
-    async def stop(self, wait: bool = True):
+    async def stop(self, wait: bool = True, grace_period: float = 30.0):
+        """Stop the workers, waiting up to `grace_period` seconds for running tasks
+
+        Workers still busy after that are cancelled. Executor jobs not yet
+        started are dropped; ones already running in a thread or process
+        are left to finish on their own. A later start() runs with new
+        executors.
+        """
         logger.info("Stopping worker pool...")
         self.running = False
 
-        if wait:
-            await asyncio.gather(*self.workers, return_exceptions=True)
+        self.queue.wake_waiters()
+        # Retries still waiting stay in the heap for the next start()
+        if self._delayed_feeder is not None:
+            self._delayed_feeder.cancel()
+            self._delayed_feeder = None
 
-        self.executor.shutdown(wait=wait)
+        if wait:
+            try:
+                async with asyncio.timeout(grace_period):
+                    await asyncio.gather(*self.workers, return_exceptions=True)
+                    if self._event_consumer is not None:
+                        await self._events.join()
+            except TimeoutError:
+                logger.warning(
+                    "Workers still busy after %ss, cancelling them", grace_period
+                )
+                for worker in self.workers:
+                    worker.cancel()
+                await asyncio.gather(*self.workers, return_exceptions=True)
+
+        if self._event_consumer is not None:
+            self._event_consumer.cancel()
+            self._event_consumer = None
+
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        if self._process_executor is not None:
+            self._process_executor.shutdown(wait=False, cancel_futures=True)
+            self._process_executor = None
+        self._executors_shut_down = True
         logger.info("Worker pool stopped")
 
     async def _worker_loop(self, worker_id: int):
         logger.info(f"Worker {worker_id} started")
+        loop = asyncio.get_running_loop()
 
         while self.running:
             try:
-                task = await self.queue.dequeue(timeout=1.0)
-
-                if task is None:
-                    await asyncio.sleep(0.1)
-                    continue
-
-                await self._execute_task(task, worker_id)
+                # Blocks until work arrives; stop() wakes idle workers
+                batch = await self.queue.dequeue_many(self.batch_size, timeout=None)
+
+                for i, task in enumerate(batch):
+                    if not self.running:
+                        # Hand the unstarted rest back for the next start()
+                        await self.queue.requeue(batch[i:])
+                        break
+                    self._active_workers += 1
+                    try:
+                        await self._execute_task(task, worker_id, loop)
+                    except asyncio.CancelledError:
+                        # stop() gave up waiting: put back what this worker
+                        # never started and fail the task it was running
+                        await self.queue.requeue(batch[i + 1:])
+                        if task.status not in TERMINAL_STATUSES:
+                            task.mark_failed("Worker stopped before the task finished")
+                            self._emit_event("task_failed", task)
+                        raise
+                    finally:
+                        self._active_workers -= 1
 
             except Exception as e:
                 logger.error(f"Worker {worker_id} error: {e}", exc_info=True)
@@ -267,51 +379,55 @@ class WorkerPool:
 
         logger.info(f"Worker {worker_id} stopped")
 
-    async def _execute_task(self, task: Task, worker_id: int):
-        logger.info(
-            f"Worker {worker_id} executing task {task.task_id} ({task.func_name})"
-        )
+    async def _execute_task(
+        self, task: Task, worker_id: int, loop: asyncio.AbstractEventLoop
+    ):
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Worker %d executing task %s (%s)",
+                worker_id, task.task_id, task.func_name,
+            )
 
+        # No update_task here: the queue indexes status changes as they
+        # happen, so running tasks are already visible through it
         task.mark_running()
-        await self.queue.update_task(task)
-        await self._emit_event("task_started", task)
+        self._emit_event("task_started", task)
 
-        try:
-            # Resolve function from registry
-            func = task_registry.get(task.func_name)
-            if func is None:
-                raise KeyError(f"Task function '{task.func_name}' not registered")
-
-            # Bind args + kwargs safely
-            callable_fn = partial(func, *task.args, **task.kwargs)
+        # Resolved on enqueue; fall back to the registry if it wasn't then
+        func = task.func or task_registry.get(task.func_name)
+        if func is None:
+            await self._handle_task_failure(
+                task, f"Task function '{task.func_name}' not registered"
+            )
+            return
 
-            loop = asyncio.get_running_loop()
+        try:
+            future = await self._submit(task, func, loop)
 
             if task.timeout:
-                result = await asyncio.wait_for(
-                    loop.run_in_executor(self.executor, callable_fn),
-                    timeout=task.timeout,
-                )
+                # On timeout the wrapped future's cancellation is passed on
+                # to the executor future, so a task still in its backlog
+                # never runs; one already running finishes in its thread
+                result = await asyncio.wait_for(future, timeout=task.timeout)
             else:
-                result = await loop.run_in_executor(
-                    self.executor, callable_fn
-                )
+                result = await future
 
             task.mark_completed(result)
             await self.queue.update_task(task)
-            await self._emit_event("task_completed", task)
+            self._emit_event("task_completed", task)
 
-            logger.info(f"Task {task.task_id} completed successfully")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Task %s completed successfully", task.task_id)
 
         except asyncio.TimeoutError:
             error_msg = f"Task exceeded timeout of {task.timeout}s"
-            logger.error(f"Task {task.task_id} timed out")
+            logger.error("Task %s timed out", task.task_id)
             await self._handle_task_failure(task, error_msg)
 
         except Exception as e:
             error_msg = f"{type(e).__name__}: {str(e)}"
             logger.error(
-                f"Task {task.task_id} failed: {error_msg}", exc_info=True
+                "Task %s failed: %s", task.task_id, error_msg, exc_info=True
             )
             await self._handle_task_failure(task, error_msg)
 
@@ -319,40 +435,124 @@ class WorkerPool:
         # Increment retry count FIRST
         task.retry_count += 1
 
-        if task.retry_count > task.max_retries:
+        retries_full = len(self._delayed) >= MAX_DELAYED_RETRIES
+        if task.retry_count > task.max_retries or retries_full:
             task.mark_failed(error_msg)
             await self.queue.update_task(task)
-            await self._emit_event("task_failed", task)
+            self._emit_event("task_failed", task)
             logger.error(
-                f"Task {task.task_id} failed permanently after "
-                f"{task.retry_count - 1} retries"
+                "Task %s failed permanently after %d retries%s",
+                task.task_id,
+                task.retry_count - 1,
+                " (too many pending retries)" if retries_full else "",
             )
             return
 
         task.mark_retrying()
         await self.queue.update_task(task)
-        await self._emit_event("task_retrying", task)
+        self._emit_event("task_retrying", task)
 
-        backoff_delay = 2 ** (task.retry_count - 1)
+        # Spread each delay over 0.5x-1.5x so tasks that failed together
+        # (e.g. a downstream outage) don't all retry in the same instant
+        backoff_delay = 2 ** (task.retry_count - 1) * (0.5 + random.random())
+        backoff_delay = min(backoff_delay, MAX_RETRY_DELAY)
         logger.info(
-            f"Retrying task {task.task_id} in {backoff_delay}s "
-            f"(attempt {task.retry_count}/{task.max_retries})"
+            "Retrying task %s in %.1fs (attempt %d/%d)",
+            task.task_id, backoff_delay, task.retry_count, task.max_retries,
         )
 
-        await asyncio.sleep(backoff_delay)
-        await self.queue.enqueue(task)
+        # The feeder re-enqueues it once due, so this worker can move on
+        heapq.heappush(
+            self._delayed,
+            (time.monotonic() + backoff_delay, next(self._delayed_seq), task),
+        )
+        self._delayed_wakeup.set()
+
+    async def _feed_delayed(self):
+        """Re-enqueue delayed retries as their backoff runs out"""
+        while True:
+            self._delayed_wakeup.clear()
+
+            due = []
+            now = time.monotonic()
+            while self._delayed and self._delayed[0][0] <= now:
+                due.append(heapq.heappop(self._delayed)[2])
+            if due:
+                await self.queue.enqueue_many(due)
+
+            # Sleep until the next retry is due, or until one is added
+            timeout = self._delayed[0][0] - time.monotonic() if self._delayed else None
+            try:
+                await asyncio.wait_for(self._delayed_wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _submit(
+        self, task: Task, func, loop: asyncio.AbstractEventLoop
+    ) -> asyncio.Future:
+        """Start func in its executor once that has a free thread or process"""
+        executor, slots = self._executor_for(task)
 
-    async def _emit_event(self, event_type: str, task: Task):
+        await slots.acquire()
+        try:
+            # Submit directly rather than via run_in_executor, which only
+            # forwards positional args
+            cf = executor.submit(func, *task.args, **task.kwargs)
+        except BaseException:
+            slots.release()
+            raise
+
+        def release_slot(_):
+            try:
+                loop.call_soon_threadsafe(slots.release)
+            except RuntimeError:
+                pass  # Loop closed while the job ran on after stop()
+
+        cf.add_done_callback(release_slot)
+        return asyncio.wrap_future(cf, loop=loop)
+
+    def _executor_for(self, task: Task) -> Tuple[Executor, asyncio.Semaphore]:
+        """Thread pool for I/O-bound tasks, process pool for CPU-bound ones"""
+        if task_registry.mode(task.func_name) != "cpu":
+            return self.executor, self._thread_slots
+        if self._process_executor is None:
+            # Not fork: the server already runs threads, and forking a
+            # multi-threaded process can deadlock the child
+            self._process_executor = ProcessPoolExecutor(
+                max_workers=self.process_pool_size,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._process_executor, self._process_slots
+
+    def _emit_event(self, event_type: str, task: Task):
         if not self.event_callback:
             return
         try:
-            await self.event_callback(event_type, task)
-        except Exception as e:
-            logger.error(f"Error in event callback: {e}")
+            # Snapshot now: the task may have moved on by the time the
+            # consumer gets to this event
+            data = task.to_dict() if self._callback_takes_data else None
+            self._events.put_nowait((event_type, task, data))
+        except asyncio.QueueFull:
+            logger.warning(
+                "Event queue full, dropped %s for task %s", event_type, task.task_id
+            )
+
+    async def _drain_events(self):
+        while True:
+            event_type, task, data = await self._events.get()
+            try:
+                if self._callback_takes_data:
+                    await self.event_callback(event_type, task, data)
+                else:
+                    await self.event_callback(event_type, task)
+            except Exception as e:
+                logger.error(f"Error in event callback: {e}")
+            finally:
+                self._events.task_done()
 
     async def get_stats(self) -> dict:
         return {
             "num_workers": self.num_workers,
             "running": self.running,
-            "active_workers": sum(1 for w in self.workers if not w.done()),
+            "active_workers": self._active_workers,
         }
@@ -0,0 +1,11 @@
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+
+@pytest.fixture(scope="session")
+def session():
+    """HTTP session shared by every API test, so connections are kept alive"""
+    with requests.Session() as s:
+        s.mount("http://", HTTPAdapter(pool_maxsize=32))
+        yield s
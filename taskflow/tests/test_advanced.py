@@ -1,46 +1,46 @@
 import time
-import requests
 
 BASE_URL = "http://localhost:8000/api/v1"
 
 
-def wait_for_task(task_id, timeout=20):
-    start = time.time()
-    while time.time() - start < timeout:
-        resp = requests.get(f"{BASE_URL}/tasks/{task_id}")
-        assert resp.status_code == 200
-        task = resp.json()
-
-        if task["status"] in ("completed", "failed"):
-            return task
+def wait_for_task(session, task_id, timeout=20):
+    # The server holds the request until the task finishes or timeout passes
+    resp = session.get(
+        f"{BASE_URL}/tasks/{task_id}/wait",
+        params={"timeout": timeout},
+        timeout=timeout + 5,
+    )
+    assert resp.status_code == 200
+    task = resp.json()
 
-        time.sleep(0.5)
+    if task["status"] in ("completed", "failed"):
+        return task
 
     raise AssertionError(f"Task {task_id} did not finish in time")
 
 
-def test_retry_behavior():
+def test_retry_behavior(session):
     """
     random_failure should retry and eventually succeed or fail
     """
-    resp = requests.post(
+    resp = session.post(
         f"{BASE_URL}/tasks",
         json={"func_name": "random_failure"},
     )
     assert resp.status_code == 201
 
     task_id = resp.json()["task_id"]
-    task = wait_for_task(task_id, timeout=20)
+    task = wait_for_task(session, task_id, timeout=20)
 
     assert task["status"] in ("completed", "failed")
     assert task["retry_count"] >= 0
 
 
-def test_timeout_failure():
+def test_timeout_failure(session):
     """
     slow_task with too-small timeout should eventually fail after retries
     """
-    resp = requests.post(
+    resp = session.post(
         f"{BASE_URL}/tasks",
         json={
             "func_name": "slow_task",
@@ -51,17 +51,17 @@ def test_timeout_failure():
     assert resp.status_code == 201
 
     task_id = resp.json()["task_id"]
-    task = wait_for_task(task_id, timeout=25)
+    task = wait_for_task(session, task_id, timeout=25)
 
     assert task["status"] == "failed"
     assert "timeout" in task["error"].lower()
 
 
-def test_concurrent_tasks():
+def test_concurrent_tasks(session):
     task_ids = []
 
     for i in range(5):
-        resp = requests.post(
+        resp = session.post(
             f"{BASE_URL}/tasks",
             json={
                 "func_name": "add_numbers",
@@ -73,15 +73,37 @@ def test_concurrent_tasks():
 
     results = []
     for task_id in task_ids:
-        task = wait_for_task(task_id)
+        task = wait_for_task(session, task_id)
         assert task["status"] == "completed"
         results.append(task["result"])
 
     assert sorted(results) == [0, 2, 4, 6, 8]
 
 
-def test_metrics_consistency():
-    resp = requests.get(f"{BASE_URL}/metrics")
+def test_bulk_submission(session):
+    resp = session.post(
+        f"{BASE_URL}/tasks/bulk",
+        json=[
+            {"func_name": "add_numbers", "kwargs": {"a": i, "b": 10}}
+            for i in range(3)
+        ],
+    )
+    assert resp.status_code == 201
+    task_ids = [t["task_id"] for t in resp.json()]
+    assert len(task_ids) == 3
+
+    results = [wait_for_task(session, task_id)["result"] for task_id in task_ids]
+    assert results == [10, 11, 12]
+
+    resp = session.post(
+        f"{BASE_URL}/tasks/bulk",
+        json=[{"func_name": "add_numbers"}, {"func_name": "no_such_task"}],
+    )
+    assert resp.status_code == 404
+
+
+def test_metrics_consistency(session):
+    resp = session.get(f"{BASE_URL}/metrics")
     assert resp.status_code == 200
 
     metrics = resp.json()["queue"]
@@ -90,8 +112,8 @@ def test_metrics_consistency():
     assert metrics["current_size"] == 0
 
 
-def test_periodic_task_execution():
-    resp = requests.post(
+def test_periodic_task_execution(session):
+    resp = session.post(
         f"{BASE_URL}/periodic-tasks",
         json={
             "name": "test_periodic_exec",
@@ -104,7 +126,7 @@ def test_periodic_task_execution():
 
     time.sleep(65)
 
-    resp = requests.get(f"{BASE_URL}/periodic-tasks")
+    resp = session.get(f"{BASE_URL}/periodic-tasks")
     assert resp.status_code == 200
 
     periodic = resp.json()["test_periodic_exec"]
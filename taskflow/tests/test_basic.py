@@ -1,15 +1,14 @@
-import requests
 import time
 
 BASE_URL = "http://localhost:8000/api/v1"
 
 
-def test_basic_flow():
-    resp = requests.get(f"{BASE_URL}/registered-tasks")
+def test_basic_flow(session):
+    resp = session.get(f"{BASE_URL}/registered-tasks")
     assert resp.status_code == 200
     assert "add_numbers" in resp.json()["tasks"]
 
-    resp = requests.post(
+    resp = session.post(
         f"{BASE_URL}/tasks",
         json={"func_name": "add_numbers", "kwargs": {"a": 5, "b": 3}},
     )
@@ -17,7 +16,7 @@ def test_basic_flow():
     task_id = resp.json()["task_id"]
 
     for _ in range(10):
-        resp = requests.get(f"{BASE_URL}/tasks/{task_id}")
+        resp = session.get(f"{BASE_URL}/tasks/{task_id}")
         assert resp.status_code == 200
         task = resp.json()
         if task["status"] == "completed":
@@ -27,6 +26,6 @@ def test_basic_flow():
     else:
         raise AssertionError("Task did not complete in time")
 
-    resp = requests.get(f"{BASE_URL}/metrics")
+    resp = session.get(f"{BASE_URL}/metrics")
     assert resp.status_code == 200
     assert resp.json()["queue"]["completed_count"] >= 1
@@ -0,0 +1,168 @@
+import asyncio
+
+from taskflow.core.queue import TaskQueue
+from taskflow.core.task import Task, TaskPriority
+from taskflow.core.task_pool import task_pool
+
+
+def make_task(priority=TaskPriority.NORMAL):
+    return Task(priority=priority, func_name="add_numbers")
+
+
+def test_get_all_tasks_limit_keeps_newest_enqueued():
+    async def run():
+        queue = TaskQueue()
+        older, newer = make_task(), make_task()
+        await queue.enqueue(older)
+        await queue.enqueue(newer)
+
+        # Finishing order must not change which tasks count as newest
+        newer.mark_running()
+        newer.mark_completed(1)
+        older.mark_running()
+        older.mark_completed(2)
+
+        assert await queue.get_all_tasks(limit=1) == [newer]
+        assert await queue.get_all_tasks() == [older, newer]
+
+    asyncio.run(run())
+
+
+def test_dequeue_takes_highest_priority_first():
+    async def run():
+        queue = TaskQueue()
+        low = make_task(TaskPriority.LOW)
+        first_high = make_task(TaskPriority.HIGH)
+        second_high = make_task(TaskPriority.HIGH)
+        for task in (low, first_high, second_high):
+            await queue.enqueue(task)
+
+        assert await queue.dequeue(timeout=0) is first_high
+        assert await queue.dequeue(timeout=0) is second_high
+        assert await queue.dequeue(timeout=0) is low
+        assert await queue.dequeue(timeout=0) is None
+        assert queue.is_empty()
+
+    asyncio.run(run())
+
+
+def test_status_index_follows_task_transitions():
+    async def run():
+        queue = TaskQueue()
+        task = make_task()
+        await queue.enqueue(task)
+        assert await queue.get_pending_tasks() == [task]
+
+        task.mark_running()
+        task.mark_failed("boom")
+
+        assert await queue.get_pending_tasks() == []
+        assert await queue.get_failed_tasks() == [task]
+        metrics = await queue.get_metrics()
+        assert metrics["pending_count"] == 0
+        assert metrics["failed_count"] == 1
+
+    asyncio.run(run())
+
+
+def test_history_evicts_oldest_finished_task():
+    async def run():
+        queue = TaskQueue(history_size=2)
+        tasks = [make_task() for _ in range(3)]
+        for task in tasks:
+            await queue.enqueue(task)
+        ids = [task.task_id for task in tasks]
+
+        for task in tasks:
+            task.mark_running()
+            task.mark_completed()
+
+        assert await queue.get_task(ids[0]) is None
+        assert [t.task_id for t in await queue.get_all_tasks()] == ids[1:]
+        assert [t.task_id for t in await queue.get_completed_tasks()] == ids[1:]
+
+    asyncio.run(run())
+
+
+def test_requeue_restores_order_and_metrics():
+    async def run():
+        queue = TaskQueue()
+        tasks = [make_task() for _ in range(3)]
+        await queue.enqueue_many(tasks)
+
+        batch = await queue.dequeue_many(2, timeout=0)
+        assert batch == tasks[:2]
+        await queue.requeue(batch)
+
+        assert await queue.dequeue_many(3, timeout=0) == tasks
+        metrics = await queue.get_metrics()
+        assert metrics["total_enqueued"] == 3
+        assert metrics["total_dequeued"] == 3
+
+    asyncio.run(run())
+
+
+def test_clear_detaches_running_tasks():
+    async def run():
+        queue = TaskQueue(history_size=1)
+        running = [make_task() for _ in range(2)]
+        await queue.enqueue_many(running)
+        for task in await queue.dequeue_many(2, timeout=0):
+            task.mark_running()
+
+        await queue.clear()
+
+        # Finishing after the clear must neither fail nor reappear in listings
+        for task in running:
+            task.mark_completed(1)
+            assert task.result == 1
+            assert await queue.get_task(task.task_id) is None
+        assert await queue.get_completed_tasks() == []
+
+        later = make_task()
+        await queue.enqueue(later)
+        assert await queue.dequeue(timeout=0) is later
+        later.mark_running()
+        later.mark_completed()
+        assert await queue.get_all_tasks() == [later]
+
+    asyncio.run(run())
+
+
+def test_dropped_tasks_are_not_recycled():
+    async def run():
+        queue = TaskQueue(history_size=1)
+        pooled = len(task_pool)
+        tasks = [make_task() for _ in range(2)]
+        await queue.enqueue_many(tasks)
+        for task in tasks:
+            task.mark_running()
+            task.mark_completed()
+        await queue.clear()
+
+        # Events or responses may still hold them, so they must not come
+        # back out of the pool as new tasks
+        assert len(task_pool) == pooled
+        fresh = task_pool.acquire(priority=TaskPriority.NORMAL)
+        assert all(fresh is not task for task in tasks)
+        assert tasks[0].to_dict()["status"] == "completed"
+
+    asyncio.run(run())
+
+
+def test_reset_and_status_change_drop_cached_encodings():
+    task = make_task()
+    task.mark_running()
+    task.mark_completed(1)
+    task.json_cache = b"{}"
+
+    task.reset(priority=TaskPriority.NORMAL, func_name="add_numbers")
+    assert task.json_cache is None
+    assert task.to_dict()["status"] == "pending"
+
+    task.mark_running()
+    task.mark_completed(2)
+    task.json_cache = b"{}"
+    task.mark_queued()
+    assert task.json_cache is None
+    assert task.to_dict()["status"] == "queued"
@@ -0,0 +1,86 @@
+import asyncio
+import time
+
+from taskflow.core.queue import TaskQueue
+from taskflow.core.registry import task_registry
+from taskflow.core.task import Task, TaskPriority
+from taskflow.core.worker import WorkerPool
+
+
+@task_registry.register("test_sleep")
+def sleep_for(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def make_task(*args):
+    return Task(priority=TaskPriority.NORMAL, func_name="test_sleep", args=args)
+
+
+async def wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached in time"
+        await asyncio.sleep(0.01)
+
+
+def test_stop_after_grace_period_requeues_unstarted_batch():
+    async def run():
+        queue = TaskQueue()
+        pool = WorkerPool(queue, num_workers=1, batch_size=3)
+        tasks = [make_task(0.5) for _ in range(3)]
+        await queue.enqueue_many(tasks)
+
+        await pool.start()
+        await wait_until(lambda: tasks[0].status == "running")
+        await pool.stop(grace_period=0.1)
+
+        assert tasks[0].status == "failed"
+        assert [t.status for t in tasks[1:]] == ["queued", "queued"]
+        assert queue.size() == 2
+        assert await queue.dequeue_many(3, timeout=0) == tasks[1:]
+
+    asyncio.run(run())
+
+
+def test_event_callbacks_with_and_without_snapshot():
+    async def run():
+        seen = {"two": [], "three": []}
+
+        async def two_args(event_type, task):
+            seen["two"].append((event_type, task.task_id))
+
+        async def three_args(event_type, task, data):
+            seen["three"].append((event_type, data["status"]))
+
+        for name, callback in (("two", two_args), ("three", three_args)):
+            queue = TaskQueue()
+            pool = WorkerPool(queue, num_workers=1, event_callback=callback)
+            task = make_task(0)
+            await queue.enqueue(task)
+            await pool.start()
+            await wait_until(lambda: len(seen[name]) == 2)
+            await pool.stop()
+
+        assert [event for event, _ in seen["two"]] == ["task_started", "task_completed"]
+        assert seen["three"] == [("task_started", "running"), ("task_completed", "completed")]
+
+    asyncio.run(run())
+
+
+def test_restart_after_stop_runs_new_and_pending_tasks():
+    async def run():
+        queue = TaskQueue()
+        pool = WorkerPool(queue, num_workers=1)
+        await pool.start()
+        await pool.stop()
+
+        task = make_task(0)
+        await queue.enqueue(task)
+        await pool.start()
+        await wait_until(lambda: task.status in ("completed", "failed"))
+        await pool.stop()
+
+        assert task.status == "completed", task.error
+
+    asyncio.run(run())